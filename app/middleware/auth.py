@@ -1,14 +1,17 @@
 #!/usr/bin/python3
 """a middleware authentication """
+from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Annotated
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from pydantic import BaseModel
 from sqlmodel import Session, select
+from engine import db_manager
 from models.user import User
+from services.devices import device_tracker
 from os import getenv
 
 
@@ -78,9 +81,9 @@ class AuthManager:
         
         # Set expiration time
         if expires_delta:
-            expire = datetime.now(timezone.utcnow) + expires_delta
+            expire = datetime.now(timezone.utc) + expires_delta
         else:
-            expire = datetime.now(timezone.utcnow) + timedelta(minutes=15)
+            expire = datetime.now(timezone.utc) + timedelta(minutes=15)
         
         to_encode.update({"exp": expire})
         
@@ -142,7 +145,7 @@ class AuthMiddleware:
     @staticmethod
     async def get_current_user(
         token: Annotated[str, Depends(oauth2_scheme)],
-        session: Session
+        session: Annotated[Session, Depends(db_manager.get_session)]
     ) -> User:
         """
         Get the current authenticated user from JWT token
@@ -188,13 +191,22 @@ class AuthMiddleware:
 
     @staticmethod
     async def get_current_active_user(
-        current_user: Annotated[User, Depends(AuthMiddleware.get_current_user)]
+        request: Request,
+        current_user: Annotated[User, Depends(AuthMiddleware.get_current_user)],
+        x_device_id: Annotated[Optional[str], Header()] = None
     ) -> User:
         """
-        Get the current active user
+        Get the current active user and record activity for the
+        requesting device
+
+        The write to `UserDevice.last_used` is deferred to the device
+        tracker's periodic batched flush, so authenticated reads stay
+        read-only. Device ids not registered for the user are ignored.
         
         Args:
+            request (Request): Incoming request
             current_user (User): Authenticated user
+            x_device_id (Optional[str]): Device identifier header
         
         Returns:
             User: Active user
@@ -207,6 +219,9 @@ class AuthMiddleware:
                 status_code=status.HTTP_400_BAD_REQUEST, 
                 detail="Inactive user"
             )
+        if x_device_id:
+            ip_address = request.client.host if request.client else None
+            device_tracker.touch(current_user.id, x_device_id, ip_address)
         return current_user
 
 # Example protected route
@@ -6,15 +6,15 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi import APIRouter
-from engine.dbase import DBSessionManager, Session
+from engine import db_manager
+from engine.dbase import Session
 
 router = APIRouter()
-db_manager = DBSessionManager()
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    session: Session = Depends(db_manager.session_scope)
+    session: Session = Depends(db_manager.get_session)
 ):
     """
     OAuth2 compatible token login endpoint
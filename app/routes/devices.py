@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""a module for device routes"""
+from typing import Annotated
+from fastapi import APIRouter, Depends
+from app.middleware.auth import AuthMiddleware
+from models.user import User
+from services.devices import device_tracker
+
+
+router = APIRouter()
+
+@router.get("/users/me/devices", tags=["users"])
+async def get_active_devices(
+    current_user: Annotated[User, Depends(AuthMiddleware.get_current_active_user)]
+):
+    """a route to list the current user's active devices"""
+    return [
+        {
+            "device_id": device.device_id,
+            "ip_address": device.ip_address,
+            "last_used": device.last_used,
+        }
+        for device in device_tracker.active_devices(current_user.id)
+    ]
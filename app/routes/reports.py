@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""a module for crime report routes"""
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import select
+from app.middleware.auth import AuthMiddleware
+from engine import db_manager
+from engine.dbase import Session
+from models.crime import CrimeMediaFile, CrimeReport
+from models.user import User
+
+
+router = APIRouter()
+
+@router.get("/reports", tags=["reports"])
+async def get_reports(
+    current_user: Annotated[User, Depends(AuthMiddleware.get_current_active_user)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    session: Session = Depends(db_manager.get_session)
+):
+    """a route to list crime reports, oldest first"""
+    statement = (
+        select(CrimeReport)
+        .order_by(CrimeReport.id)
+        .offset(offset)
+        .limit(limit)
+    )
+    return session.exec(statement).all()
+
+
+@router.get("/reports/{report_id}", tags=["reports"])
+async def get_report(
+    report_id: int,
+    current_user: Annotated[User, Depends(AuthMiddleware.get_current_active_user)],
+    session: Session = Depends(db_manager.get_session)
+):
+    """a route to get a crime report with its media files"""
+    report = session.get(CrimeReport, report_id)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+    statement = select(CrimeMediaFile).where(
+        CrimeMediaFile.crime_report_id == report_id
+    )
+    return {
+        "report": report,
+        "media_files": session.exec(statement).all()
+    }
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""a module for the concurrent load generator"""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import asyncio
+import math
+import time
+import httpx
+
+
+@dataclass
+class Scenario:
+    """
+    A single endpoint to drive under load
+
+    Attributes:
+        name (str): Scenario name used in the results
+        method (str): HTTP method
+        path (str): Request path
+        data (Optional[dict]): Form body, for POST endpoints
+        headers (Dict[str, str]): Extra request headers
+        expected_status (int): Status code of a successful response;
+            any other response counts as an error
+    """
+    name: str
+    method: str
+    path: str
+    data: Optional[dict] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    expected_status: int = 200
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples
+
+    Args:
+        samples (List[float]): Samples, in any order
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile, or 0.0 for no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(name: str,
+              latencies: List[float],
+              statuses: Counter,
+              elapsed: float,
+              concurrency: int,
+              expected_status: int = 200) -> dict:
+    """
+    Build the result record for a scenario
+
+    Args:
+        name (str): Scenario name
+        latencies (List[float]): Per-request latencies in seconds
+        statuses (Counter): Response status code counts
+        elapsed (float): Wall clock time of the run in seconds
+        concurrency (int): Number of concurrent workers
+        expected_status (int): Status code of a successful response
+
+    Returns:
+        dict: Throughput, latency percentiles (ms) and status counts
+    """
+    total = len(latencies)
+    errors = sum(n for code, n in statuses.items() if code != expected_status)
+    return {
+        "name": name,
+        "requests": total,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "min": round(min(latencies, default=0.0) * 1000, 3),
+            "mean": round(sum(latencies) / total * 1000, 3) if total else 0.0,
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "max": round(max(latencies, default=0.0) * 1000, 3),
+        },
+        "expected_status": expected_status,
+        "status_codes": {str(code): n for code, n in sorted(statuses.items())},
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+    }
+
+
+async def run_scenario(client: httpx.AsyncClient,
+                       scenario: Scenario,
+                       requests: int,
+                       concurrency: int,
+                       warmup: int = 0) -> dict:
+    """
+    Drive a scenario with a fixed number of requests spread
+    across concurrent workers
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the app or server
+        scenario (Scenario): Endpoint to drive
+        requests (int): Number of measured requests
+        concurrency (int): Number of concurrent workers
+        warmup (int): Unmeasured requests sent first
+
+    Returns:
+        dict: Result record, see `summarize`
+    """
+    async def send() -> int:
+        try:
+            response = await client.request(
+                scenario.method,
+                scenario.path,
+                data=scenario.data,
+                headers=scenario.headers
+            )
+            return response.status_code
+        except httpx.HTTPError:
+            # Transport failures are reported as status 0
+            return 0
+
+    for _ in range(warmup):
+        await send()
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            code = await send()
+            latencies.append(time.perf_counter() - start)
+            statuses[code] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return summarize(scenario.name, latencies, statuses, elapsed,
+                     concurrency, scenario.expected_status)
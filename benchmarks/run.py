@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+a command line entry point for the API benchmark suite
+
+Usage:
+    python -m benchmarks.run --users 1000 --requests 2000 --concurrency 16 \
+        --output bench_results.json --compare baseline.json
+"""
+from datetime import datetime, timezone
+from typing import List, Optional
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Keep the repo importable when run as a script
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import httpx
+from benchmarks.load import Scenario, run_scenario
+from benchmarks.seed import BENCH_PASSWORD, SeedScale, seed_database
+
+
+BENCH_USER = "user1"
+BENCH_DEVICE = "device1"
+
+
+class BenchmarkError(Exception):
+    """Raised when the target cannot serve the benchmark scenarios"""
+
+
+async def check_login(client: httpx.AsyncClient) -> str:
+    """
+    Log in as the benchmark user before measuring anything
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the app or server
+
+    Returns:
+        str: Bearer token issued by the target's /token endpoint
+
+    Raises:
+        BenchmarkError: If /token does not return 200
+    """
+    response = await client.post(
+        "/token",
+        data={"username": BENCH_USER, "password": BENCH_PASSWORD}
+    )
+    if response.status_code != 200:
+        raise BenchmarkError(
+            f"login as {BENCH_USER} returned {response.status_code}: "
+            f"{response.text}"
+        )
+    return response.json()["access_token"]
+
+
+def build_scenarios(token: str) -> List[Scenario]:
+    """
+    Build the default endpoint scenarios
+
+    Args:
+        token (str): Bearer token for authenticated endpoints
+
+    Returns:
+        List[Scenario]: Scenarios to drive
+    """
+    auth_headers = {
+        "Authorization": f"Bearer {token}",
+        "X-Device-ID": BENCH_DEVICE,
+    }
+    return [
+        Scenario(
+            "token", "POST", "/token",
+            data={"username": BENCH_USER, "password": BENCH_PASSWORD}
+        ),
+        Scenario("users", "GET", "/users"),
+        Scenario("users_me", "GET", "/users/me/", headers=auth_headers),
+        Scenario("devices", "GET", "/users/me/devices", headers=auth_headers),
+        Scenario("reports", "GET", "/reports?limit=20", headers=auth_headers),
+        Scenario("report", "GET", "/reports/1", headers=auth_headers),
+    ]
+
+
+def git_revision() -> Optional[str]:
+    """
+    Return the current git commit of the repository, if any
+    """
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(current: dict, baseline: dict, threshold: float) -> bool:
+    """
+    Print per-scenario deltas against a baseline run
+
+    Args:
+        current (dict): Results of this run
+        baseline (dict): Results of a previous run
+        threshold (float): Allowed p95 latency increase in percent
+
+    Returns:
+        bool: True if any scenario regressed beyond the threshold
+    """
+    previous = {s["name"]: s for s in baseline.get("scenarios", [])}
+    regressed = False
+    print(f"{'scenario':<12} {'rps':>18} {'p95 ms':>22}")
+    for result in current["scenarios"]:
+        old = previous.get(result["name"])
+        if old is None:
+            continue
+        rps, old_rps = result["throughput_rps"], old["throughput_rps"]
+        p95, old_p95 = result["latency_ms"]["p95"], old["latency_ms"]["p95"]
+        change = (p95 - old_p95) / old_p95 * 100 if old_p95 else 0.0
+        flag = ""
+        if change > threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        print(f"{result['name']:<12} {old_rps:>8} -> {rps:<8} "
+              f"{old_p95:>8} -> {p95:<8} ({change:+.1f}%){flag}")
+    return regressed
+
+
+async def run_scenarios(client: httpx.AsyncClient,
+                        args: argparse.Namespace) -> List[dict]:
+    """
+    Drive every selected scenario, logging in before each one so
+    the token comes from the target and stays fresh on long runs
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the app or server
+        args (argparse.Namespace): Parsed command line arguments
+
+    Returns:
+        List[dict]: Result record per scenario
+    """
+    names = [s.name for s in build_scenarios("")]
+    if args.scenario:
+        names = [name for name in names if name in args.scenario]
+
+    results = []
+    async with client:
+        for name in names:
+            token = await check_login(client)
+            scenario = next(
+                s for s in build_scenarios(token) if s.name == name
+            )
+            result = await run_scenario(
+                client, scenario, args.requests, args.concurrency, args.warmup
+            )
+            print(f"{result['name']:<12} {result['throughput_rps']:>10} rps  "
+                  f"p50 {result['latency_ms']['p50']:>8} ms  "
+                  f"p95 {result['latency_ms']['p95']:>8} ms  "
+                  f"p99 {result['latency_ms']['p99']:>8} ms  "
+                  f"errors {result['error_rate']:.2%}")
+            results.append(result)
+    return results
+
+
+async def run_benchmarks(args: argparse.Namespace) -> List[dict]:
+    """
+    Drive the scenarios against a live server, or against the app
+    in-process with its startup and shutdown events running
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+
+    Returns:
+        List[dict]: Result record per scenario
+    """
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url)
+        return await run_scenarios(client, args)
+
+    from server import app
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+    # ASGITransport does not send lifespan events, so run them here
+    async with app.router.lifespan_context(app):
+        return await run_scenarios(client, args)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments
+    """
+    defaults = SeedScale()
+    parser = argparse.ArgumentParser(description="crime tracker API benchmarks")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--reports-per-user", type=int,
+                        default=defaults.reports_per_user)
+    parser.add_argument("--media-per-report", type=int,
+                        default=defaults.media_per_report)
+    parser.add_argument("--audit-per-user", type=int,
+                        default=defaults.audit_per_user)
+    parser.add_argument("--seed", type=int, default=defaults.seed,
+                        help="random seed for the synthetic data")
+    parser.add_argument("--requests", type=int, default=1000,
+                        help="measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--scenario", action="append",
+                        help="only run the named scenario (repeatable)")
+    parser.add_argument("--db",
+                        help="path of the seeded database (default: a "
+                             "temporary directory); with --base-url, the "
+                             "server's CRIME_TRACKER_DB, or omit to skip "
+                             "seeding")
+    parser.add_argument("--skip-seed", action="store_true",
+                        help="reuse the database already at --db")
+    parser.add_argument("--base-url",
+                        help="drive a running server instead of the app in-process")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="baseline results JSON to compare to")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="allowed p95 increase in percent before failing")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """main function"""
+    args = parse_args(argv)
+    output = os.path.abspath(args.output)
+    compare = os.path.abspath(args.compare) if args.compare else None
+    dbname = os.path.abspath(
+        args.db or os.path.join(tempfile.mkdtemp(prefix="crime_bench_"),
+                                "crime_tracker.db")
+    )
+    # Must be set before the engine package is first imported
+    os.environ["CRIME_TRACKER_DB"] = dbname
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    # Per-request INFO logs would land inside the measured window
+    for name in ("httpx", "engine.dbase"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    scale = SeedScale(
+        users=args.users,
+        reports_per_user=args.reports_per_user,
+        media_per_report=args.media_per_report,
+        audit_per_user=args.audit_per_user,
+        seed=args.seed
+    )
+
+    # A running server reads its own database, so with --base-url only
+    # seed when --db points at the server's CRIME_TRACKER_DB
+    counts = None
+    if not args.skip_seed and (args.db or not args.base_url):
+        counts = seed_database(dbname, scale)
+        print(f"Seeded {dbname}: {counts}")
+
+    try:
+        results = asyncio.run(run_benchmarks(args))
+    except BenchmarkError as e:
+        print(f"Benchmark aborted: {e}", file=sys.stderr)
+        return 2
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": args.base_url or "in-process",
+        "scale": scale.to_dict(),
+        "rows": counts,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "warmup": args.warmup,
+        "scenarios": results,
+    }
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    failed = [r["name"] for r in results if r["errors"]]
+    if failed:
+        print(f"Unexpected responses in: {', '.join(failed)}", file=sys.stderr)
+        return 1
+
+    if compare:
+        with open(compare) as f:
+            baseline = json.load(f)
+        if compare_results(report, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""a module for seeding a synthetic benchmark database"""
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from random import Random
+from sqlalchemy import insert
+
+
+BATCH_SIZE = 5000
+BENCH_PASSWORD = "benchmark"
+
+
+@dataclass
+class SeedScale:
+    """
+    Size of the synthetic dataset
+
+    Attributes:
+        users (int): Number of users
+        reports_per_user (int): Crime reports filed by each user
+        media_per_report (int): Media files attached to each report
+        audit_per_user (int): Audit log rows written for each user
+        seed (int): Random seed, so runs are reproducible
+    """
+    users: int = 1000
+    reports_per_user: int = 5
+    media_per_report: int = 2
+    audit_per_user: int = 10
+    seed: int = 42
+
+    def to_dict(self) -> dict:
+        """
+        Return the scale as a plain dictionary
+        """
+        return asdict(self)
+
+
+def _insert_batches(session, table, rows):
+    """
+    Insert rows into a table in executemany batches
+
+    Args:
+        session (Session): Database session
+        table (Table): Target table
+        rows (Iterable[dict]): Rows to insert
+
+    Returns:
+        int: Number of rows inserted
+    """
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            session.connection().execute(insert(table), batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        session.connection().execute(insert(table), batch)
+        count += len(batch)
+    return count
+
+
+def seed_database(dbname: str, scale: SeedScale) -> dict:
+    """
+    Recreate the database tables and fill them with synthetic rows
+
+    Every user gets the password `BENCH_PASSWORD` and one registered
+    device, `device<user id>`. No route reads audit rows yet; they are
+    seeded so future audit routes are measured at scale.
+
+    Args:
+        dbname (str): Path to the SQLite database file
+        scale (SeedScale): Size of the dataset
+
+    Returns:
+        dict: Number of rows written per table
+    """
+    # Imported here so CRIME_TRACKER_DB can be set before the engine loads
+    from app.middleware.auth import AuthManager
+    from engine.dbase import DBSessionManager
+    from entity.crime_entity import CrimeCategory
+    from entity.device_entity import DeviceType
+    from models.audit import AuditLog
+    from models.crime import CrimeMediaFile, CrimeReport
+    from models.user import User, UserDevice
+
+    # Recreate the tables rather than the file, so a server already
+    # holding connections to it sees the new rows
+    db_manager = DBSessionManager(dbname=dbname)
+    db_manager.drop_tables()
+    db_manager.create_tables()
+
+    rng = Random(scale.seed)
+    now = datetime.now(timezone.utc)
+    categories = list(CrimeCategory)
+    report_count = scale.users * scale.reports_per_user
+    # bcrypt is deliberately slow, so hash once and share the hash
+    hashed_password = AuthManager.get_password_hash(BENCH_PASSWORD)
+
+    def users():
+        for user_id in range(1, scale.users + 1):
+            yield {
+                "id": user_id,
+                "username": f"user{user_id}",
+                "email": f"user{user_id}@example.com",
+                "phone_number": f"+1555{user_id:07d}",
+                "first_name": "Bench",
+                "last_name": f"User{user_id}",
+                "is_verified": True,
+                "is_active": True,
+                "disable": False,
+                "hashed_password": hashed_password,
+            }
+
+    def devices():
+        for user_id in range(1, scale.users + 1):
+            yield {
+                "user_id": user_id,
+                "device_type": rng.choice(list(DeviceType)),
+                "device_id": f"device{user_id}",
+                "last_used": now,
+            }
+
+    def reports():
+        for report_id in range(1, report_count + 1):
+            incident = now - timedelta(minutes=rng.randint(0, 525600))
+            yield {
+                "id": report_id,
+                "reporter_id": (report_id - 1) // scale.reports_per_user + 1,
+                "category": rng.choice(categories),
+                "description": f"Synthetic incident {report_id}",
+                "latitude": rng.uniform(-90, 90),
+                "longitude": rng.uniform(-180, 180),
+                "address": f"{rng.randint(1, 9999)} Benchmark Street",
+                "incident_date": incident,
+                "report_date": incident + timedelta(hours=rng.randint(0, 72)),
+                "is_verified": rng.random() < 0.5,
+                "is_resolved": rng.random() < 0.2,
+            }
+
+    def media():
+        for report_id in range(1, report_count + 1):
+            for index in range(scale.media_per_report):
+                file_type = rng.choice(["image", "video"])
+                yield {
+                    "crime_report_id": report_id,
+                    "file_path": f"media/{report_id}/{index}.{file_type}",
+                    "file_type": file_type,
+                    "upload_date": now,
+                }
+
+    def audit():
+        for user_id in range(1, scale.users + 1):
+            for _ in range(scale.audit_per_user):
+                yield {
+                    "user_id": user_id,
+                    "action": rng.choice(["login", "view_report", "create_report"]),
+                    "timestamp": now - timedelta(seconds=rng.randint(0, 86400)),
+                    "ip_address": f"10.0.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+                    "details": None,
+                }
+
+    with db_manager.session_scope() as session:
+        counts = {
+            "users": _insert_batches(session, User.__table__, users()),
+            "devices": _insert_batches(session, UserDevice.__table__, devices()),
+            "reports": _insert_batches(session, CrimeReport.__table__, reports()),
+            "media": _insert_batches(session, CrimeMediaFile.__table__, media()),
+            "audit": _insert_batches(session, AuditLog.__table__, audit()),
+        }
+    db_manager.logger.info(f"Seeded benchmark database {dbname}: {counts}")
+    return counts
@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+"""the crime tracker storage engine"""
+from engine.dbase import DBSessionManager
+from os import getenv
+
+
+db_manager = DBSessionManager(getenv('CRIME_TRACKER_DB', 'crime_tracker.db'))
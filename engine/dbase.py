@@ -3,6 +3,7 @@
 
 from typing import Type, TypeVar, Optional, List, Generic
 from sqlmodel import Field, Session, SQLModel, create_engine, select
+from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 import logging
 
@@ -25,14 +26,18 @@ class DBSessionManager:
         Initialize database engine and logging
         
         Args:
-            dbname (str): Path to the SQLite database file
+            dbname (str): Path to the SQLite database file,
+                or ':memory:' for a private in-memory database
             echo (bool): Enable SQLAlchemy logging
         """
         try:
+            # An in-memory database lives on a single shared connection
+            pool = {"poolclass": StaticPool} if dbname == ':memory:' else {}
             self.__engine = create_engine(
                 f'sqlite:///{dbname}', 
                 connect_args={"check_same_thread": False},
-                echo=echo
+                echo=echo,
+                **pool
             )
             self.__session = None
             
@@ -49,16 +54,24 @@ class DBSessionManager:
         Provide a transactional scope around a series of operations
         Automatically handles session commit and rollback
         """
-        self.__session = Session(self.__engine, expire_on_commit=False)
+        session = Session(self.__engine, expire_on_commit=False)
+        self.__session = session
         try:
-            yield self.__session
-            self.__session.commit()
+            yield session
+            session.commit()
         except Exception as e:
-            self.__session.rollback()
+            session.rollback()
             self.logger.error(f"Session error: {e}")
             raise
         finally:
-            self.__session.close()
+            session.close()
+
+    def get_session(self):
+        """
+        Yield a transactional session, for use as a FastAPI dependency
+        """
+        with self.session_scope() as session:
+            yield session
 
     def create_tables(self):
         """
@@ -71,6 +84,17 @@ class DBSessionManager:
             self.logger.error(f"Error creating tables: {e}")
             raise
 
+    def drop_tables(self):
+        """
+        Drop all defined database tables
+        """
+        try:
+            SQLModel.metadata.drop_all(self.__engine)
+            self.logger.info("Database tables dropped successfully")
+        except Exception as e:
+            self.logger.error(f"Error dropping tables: {e}")
+            raise
+
     def add(self, model: T) -> T:
         """
         Add a new model instance to the database
@@ -0,0 +1,5 @@
+#!/usr/bin/env python3
+"""crime tracker models, imported together so relationships resolve"""
+from models.user import User, UserDevice
+from models.crime import CrimeReport, CrimeMediaFile
+from models.audit import AuditLog
@@ -3,7 +3,7 @@
 from typing import List, Optional
 from sqlmodel import SQLModel, Field
 from datetime import datetime
-from base import BaseModel
+from models.base import BaseModel
 
 
 class AuditLogBase(BaseModel):
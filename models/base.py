@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import uuid4
 from datetime import datetime, timezone
-from sqlmodel import SQLModel, Field, Column, DateTime
+from sqlmodel import SQLModel, Field, DateTime
 from sqlalchemy import func
 
 class BaseModel(SQLModel):
@@ -13,20 +13,20 @@ class BaseModel(SQLModel):
     """
     id: Optional[str] = Field(
         default_factory=lambda: str(uuid4()),
-        primary_key=True,
-        sa_column=Column('id', nullable=False, unique=True)
+        primary_key=True
     )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()}
     )
     updated_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(
-            DateTime(timezone=True), 
-            server_default=func.now(), 
-            onupdate=func.now()
-        )
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={
+            "server_default": func.now(),
+            "onupdate": func.now()
+        }
     )
 
     def __init__(self, **kwargs):
@@ -1,17 +1,19 @@
 #!/usr/bin/python3
 """a module for crime models"""
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 from sqlmodel import Field, Relationship
 from datetime import datetime
-from user import User
-from report import CrimeReportBase
-from base import BaseModel
+from models.report import CrimeReportBase
+from models.base import BaseModel
+
+if TYPE_CHECKING:
+    from models.user import User
 
 class CrimeReport(CrimeReportBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # Relationships
-    reporter: User = Relationship(back_populates="crime_reports")
+    reporter: "User" = Relationship(back_populates="crime_reports")
     media_files: List["CrimeMediaFile"] = Relationship(back_populates="crime_report")
 
 class CrimeMediaFileBase(BaseModel):
@@ -4,7 +4,7 @@ from typing import Optional
 from sqlmodel import Field
 from datetime import datetime
 from entity.crime_entity import CrimeCategory
-from base import BaseModel
+from models.base import BaseModel
 
 
 class CrimeReportBase(BaseModel):
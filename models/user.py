@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """a user model"""
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
-from crime import CrimeReport
 from entity.device_entity import DeviceType
 from datetime import datetime, timezone
-from base import BaseModel
+from models.base import BaseModel
+
+if TYPE_CHECKING:
+    from models.crime import CrimeReport
 
 
 class UserBase(BaseModel):
@@ -22,6 +24,7 @@ class UserBase(BaseModel):
 
 class User(UserBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    hashed_password: Optional[str] = Field(default=None, exclude=True)
     
     # Relationships
     devices: List["UserDevice"] = Relationship(back_populates="user")
@@ -37,7 +40,7 @@ class UserDeviceBase(BaseModel):
     ip_address: Optional[str] = None
     os_version: Optional[str] = None
     app_version: Optional[str] = None
-    last_used: datetime = Field(default_factory=datetime.now(timezone.utc))
+    last_used: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class UserDevice(UserDeviceBase, table=True):
@@ -2,12 +2,13 @@
 """a crime tracker server"""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import users
-from engine.dbase import DBSessionManager
+from app.middleware.auth import setup_protected_routes
+from app.routes import auth, devices, reports, users
+from engine import db_manager
+from services.devices import device_tracker
 
 
 app = FastAPI()
-db_manager = DBSessionManager()
 
 origins = [
     "http://localhost",
@@ -18,6 +19,12 @@ origins = [
 def on_startup():
     # Create database tables
     db_manager.create_tables()
+    device_tracker.start()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    # Write any pending device activity
+    await device_tracker.stop()
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,14 +34,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.include_router(auth.router)
 app.include_router(users.router)
+app.include_router(devices.router)
+app.include_router(reports.router)
+setup_protected_routes(app)
 
 
 def main():
     """main function"""
-    from engine.dbase import DBSessionManager
-    storage = DBSessionManager()
-    storage.create_tables()
+    db_manager.create_tables()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
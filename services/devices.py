@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""a module for device/session activity tracking"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import bindparam, update
+from sqlmodel import select
+from engine import db_manager
+from engine.dbase import DBSessionManager
+from models.user import UserDevice
+import asyncio
+import logging
+import threading
+
+
+DEVICE_FLUSH_INTERVAL_SECONDS = 60
+DEVICE_ACTIVE_WINDOW_MINUTES = 30
+DEVICE_REGISTRY_TTL_SECONDS = 60
+
+
+@dataclass
+class DeviceActivity:
+    """
+    In-memory activity record for a single user device
+
+    Attributes:
+        user_id (int): Owner of the device
+        device_id (str): Client supplied device identifier
+        ip_address (Optional[str]): Last seen IP address
+        last_used (datetime): Last time the device made a request
+        last_flushed (Optional[datetime]): Last time the record was written
+        dirty (bool): Whether the record has unwritten changes
+    """
+    user_id: int
+    device_id: str
+    ip_address: Optional[str]
+    last_used: datetime
+    last_flushed: Optional[datetime] = None
+    dirty: bool = True
+
+
+class DeviceTracker:
+    """
+    Records device activity in memory and coalesces the
+    `last_used`/`ip_address` updates into periodic batched UPDATEs,
+    writing each device at most once per flush interval
+
+    Only devices registered for a user in `UserDevice` are tracked.
+    Each user's registered device ids are cached for `registry_ttl`
+    seconds, so devices added elsewhere are picked up on reload.
+    """
+
+    def __init__(self,
+                 db_manager: DBSessionManager,
+                 flush_interval: int = DEVICE_FLUSH_INTERVAL_SECONDS,
+                 active_window: int = DEVICE_ACTIVE_WINDOW_MINUTES,
+                 registry_ttl: int = DEVICE_REGISTRY_TTL_SECONDS):
+        """
+        Initialize the tracker
+
+        Args:
+            db_manager (DBSessionManager): Database session manager
+            flush_interval (int): Seconds between batched writes
+            active_window (int): Minutes a device is considered active
+            registry_ttl (int): Seconds to cache registered device ids
+        """
+        self.db_manager = db_manager
+        self.flush_interval = timedelta(seconds=flush_interval)
+        self.active_window = timedelta(minutes=active_window)
+        self.registry_ttl = timedelta(seconds=registry_ttl)
+        self.__activity: Dict[Tuple[int, str], DeviceActivity] = {}
+        self.__registered: Dict[int, Tuple[Set[str], datetime]] = {}
+        self.__lock = threading.Lock()
+        self.__task: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger(__name__)
+
+    def registered_devices(self,
+                           user_id: int,
+                           now: Optional[datetime] = None) -> Set[str]:
+        """
+        Return the device ids registered for a user, reloading them
+        once the cached entry is older than the registry TTL
+
+        Args:
+            user_id (int): Owner of the devices
+            now (Optional[datetime]): Reference time, defaults to now
+
+        Returns:
+            Set[str]: Registered device ids
+        """
+        now = now or datetime.now(timezone.utc)
+        with self.__lock:
+            cached = self.__registered.get(user_id)
+        if cached is not None and now - cached[1] < self.registry_ttl:
+            return cached[0]
+
+        statement = select(UserDevice.device_id).where(
+            UserDevice.user_id == user_id
+        )
+        with self.db_manager.session_scope() as session:
+            devices = set(session.exec(statement).all())
+        with self.__lock:
+            self.__registered[user_id] = (devices, now)
+        return devices
+
+    def register(self,
+                 user_id: int,
+                 device_id: str,
+                 now: Optional[datetime] = None):
+        """
+        Add a newly created `UserDevice` to the registered device cache
+
+        Args:
+            user_id (int): Owner of the device
+            device_id (str): Client supplied device identifier
+            now (Optional[datetime]): Reference time, defaults to now
+        """
+        devices = self.registered_devices(user_id, now)
+        with self.__lock:
+            devices.add(device_id)
+
+    def touch(self,
+              user_id: int,
+              device_id: str,
+              ip_address: Optional[str] = None,
+              now: Optional[datetime] = None) -> Optional[DeviceActivity]:
+        """
+        Record activity for a registered device without writing to
+        the database
+
+        Args:
+            user_id (int): Owner of the device
+            device_id (str): Client supplied device identifier
+            ip_address (Optional[str]): Request IP address
+            now (Optional[datetime]): Activity time, defaults to now
+
+        Returns:
+            Optional[DeviceActivity]: The updated in-memory record,
+                or None if the device is not registered for the user
+        """
+        now = now or datetime.now(timezone.utc)
+        if device_id not in self.registered_devices(user_id, now):
+            return None
+        key = (user_id, device_id)
+        with self.__lock:
+            activity = self.__activity.get(key)
+            if activity is None:
+                activity = DeviceActivity(user_id, device_id, ip_address, now)
+                self.__activity[key] = activity
+            else:
+                activity.last_used = now
+                if ip_address:
+                    activity.ip_address = ip_address
+                activity.dirty = True
+            return activity
+
+    def active_devices(self,
+                       user_id: int,
+                       now: Optional[datetime] = None) -> List[DeviceActivity]:
+        """
+        List a user's devices seen within the active window
+
+        Args:
+            user_id (int): User to list devices for
+            now (Optional[datetime]): Reference time, defaults to now
+
+        Returns:
+            List[DeviceActivity]: Active devices, most recent first
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - self.active_window
+        with self.__lock:
+            devices = [
+                DeviceActivity(**vars(activity))
+                for activity in self.__activity.values()
+                if activity.user_id == user_id and activity.last_used >= cutoff
+            ]
+        return sorted(devices, key=lambda d: d.last_used, reverse=True)
+
+    def flush(self, force: bool = False, now: Optional[datetime] = None) -> int:
+        """
+        Write pending activity to the database in a single batched UPDATE
+
+        Args:
+            force (bool): Ignore the flush interval (used on shutdown)
+            now (Optional[datetime]): Reference time, defaults to now
+
+        Returns:
+            int: Number of devices written
+        """
+        now = now or datetime.now(timezone.utc)
+        with self.__lock:
+            pending = [
+                activity for activity in self.__activity.values()
+                if activity.dirty and (
+                    force or activity.last_flushed is None
+                    or now - activity.last_flushed >= self.flush_interval
+                )
+            ]
+            rows = [
+                {
+                    "b_user_id": activity.user_id,
+                    "b_device_id": activity.device_id,
+                    "last_used": activity.last_used,
+                    "ip_address": activity.ip_address,
+                }
+                for activity in pending
+            ]
+            for activity in pending:
+                activity.dirty = False
+                activity.last_flushed = now
+
+        if rows:
+            self.__write(rows, pending)
+
+        # Drop idle records only once their activity has been written,
+        # along with expired registered device ids
+        cutoff = now - self.active_window
+        with self.__lock:
+            for key, activity in list(self.__activity.items()):
+                if not activity.dirty and activity.last_used < cutoff:
+                    del self.__activity[key]
+            for user_id, (_, loaded) in list(self.__registered.items()):
+                if now - loaded >= self.registry_ttl:
+                    del self.__registered[user_id]
+        return len(rows)
+
+    def __write(self, rows: List[dict], pending: List[DeviceActivity]):
+        """
+        Run the batched UPDATE, restoring the records on failure
+
+        Args:
+            rows (List[dict]): Bound parameters, one per device
+            pending (List[DeviceActivity]): Records being written
+        """
+        table = UserDevice.__table__
+        statement = (
+            update(table)
+            .where(table.c.user_id == bindparam("b_user_id"))
+            .where(table.c.device_id == bindparam("b_device_id"))
+            .values(
+                last_used=bindparam("last_used"),
+                ip_address=bindparam("ip_address")
+            )
+        )
+        try:
+            with self.db_manager.session_scope() as session:
+                session.connection().execute(statement, rows)
+        except Exception as e:
+            self.logger.error(f"Error flushing device activity: {e}")
+            with self.__lock:
+                for activity in pending:
+                    activity.dirty = True
+                    activity.last_flushed = None
+            raise
+
+    async def __run(self):
+        """
+        Periodically flush pending activity until cancelled
+        """
+        interval = self.flush_interval.total_seconds()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                # Records stay dirty and are retried on the next tick
+                pass
+
+    def start(self):
+        """
+        Start the background flush task on the running event loop
+        """
+        if self.__task is None:
+            self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    async def stop(self):
+        """
+        Stop the background flush task and write all pending activity
+        """
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+        await asyncio.to_thread(self.flush, True)
+
+
+device_tracker = DeviceTracker(db_manager)
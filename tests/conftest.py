@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+"""shared test configuration"""
+import os
+
+# The engine reads these when first imported
+os.environ.setdefault("CRIME_TRACKER_DB", ":memory:")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""tests for the benchmark statistics and regression comparison"""
+from collections import Counter
+import asyncio
+import httpx
+import pytest
+from benchmarks.load import percentile, summarize
+from benchmarks.run import BenchmarkError, check_login, compare_results
+
+
+def result(name, p95, rps=100.0):
+    return {
+        "name": name,
+        "throughput_rps": rps,
+        "latency_ms": {"p50": p95 / 2, "p95": p95, "p99": p95 * 2},
+    }
+
+
+@pytest.mark.parametrize("pct, expected", [
+    (50, 50), (95, 95), (99, 99), (100, 100), (0, 1),
+])
+def test_percentile_nearest_rank(pct, expected):
+    samples = list(range(100, 0, -1))
+    assert percentile(samples, pct) == expected
+
+
+def test_percentile_small_and_empty_samples():
+    assert percentile([0.3, 0.1, 0.2], 50) == 0.2
+    assert percentile([0.3, 0.1, 0.2], 99) == 0.3
+    assert percentile([], 95) == 0.0
+
+
+def test_summarize_counts_unexpected_status_as_error():
+    latencies = [0.001] * 10
+    statuses = Counter({200: 6, 401: 2, 404: 1, 0: 1})
+    summary = summarize("x", latencies, statuses, 0.5, 2)
+    assert summary["errors"] == 4
+    assert summary["error_rate"] == 0.4
+    assert summary["throughput_rps"] == 20.0
+    assert summary["latency_ms"]["p95"] == 1.0
+
+    summary = summarize("x", latencies, Counter({404: 10}), 0.5, 2, 404)
+    assert summary["errors"] == 0
+
+
+def test_compare_flags_p95_regression_past_threshold(capsys):
+    baseline = {"scenarios": [result("users", 10.0), result("token", 10.0)]}
+    current = {"scenarios": [result("users", 11.0), result("token", 11.5)]}
+    assert compare_results(current, baseline, threshold=10.0) is True
+    out = capsys.readouterr().out
+    assert "token" in out and "REGRESSION" in out
+    assert "users" in out and out.count("REGRESSION") == 1
+
+
+def test_compare_within_threshold_or_faster_passes():
+    baseline = {"scenarios": [result("users", 10.0), result("token", 10.0)]}
+    current = {"scenarios": [result("users", 10.9), result("token", 5.0)]}
+    assert compare_results(current, baseline, threshold=10.0) is False
+
+
+def test_compare_ignores_scenarios_missing_from_baseline():
+    baseline = {"scenarios": [result("users", 10.0)]}
+    current = {"scenarios": [result("users", 10.0), result("devices", 99.0)]}
+    assert compare_results(current, baseline, threshold=10.0) is False
+
+
+def login(status_code, body):
+    def handler(request):
+        assert request.url.path == "/token"
+        return httpx.Response(status_code, json=body)
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport,
+                                     base_url="http://bench") as client:
+            return await check_login(client)
+
+    return asyncio.run(run())
+
+
+def test_check_login_returns_token_issued_by_target():
+    token = login(200, {"access_token": "from-server", "token_type": "bearer"})
+    assert token == "from-server"
+
+
+def test_check_login_fails_when_login_is_rejected():
+    with pytest.raises(BenchmarkError):
+        login(401, {"detail": "Incorrect username or password"})
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""tests for device tracking through the application"""
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+import pytest
+from app.middleware.auth import AuthManager
+from engine import db_manager
+from entity.device_entity import DeviceType
+from models.user import User, UserDevice
+from server import app
+from services.devices import device_tracker
+
+
+STALE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def add_user(user_id, device_id):
+    with db_manager.session_scope() as session:
+        session.add(User(
+            id=user_id,
+            username=f"user{user_id}",
+            email=f"user{user_id}@example.com"
+        ))
+        session.add(UserDevice(
+            user_id=user_id,
+            device_type=DeviceType.MOBILE,
+            device_id=device_id,
+            last_used=STALE
+        ))
+    token = AuthManager.create_access_token(data={"sub": f"user{user_id}"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def stored_device(device_id):
+    return db_manager.query(UserDevice, filters={"device_id": device_id})[0]
+
+
+def test_authenticated_route_records_device_activity(client):
+    headers = add_user(10, "device10")
+    response = client.get(
+        "/users/me/", headers={**headers, "X-Device-ID": "device10"}
+    )
+    assert response.status_code == 200
+
+    devices = device_tracker.active_devices(10)
+    assert [d.device_id for d in devices] == ["device10"]
+    # Recorded in memory only until the next flush
+    assert stored_device("device10").ip_address is None
+
+
+def test_devices_listed_and_flushed_on_shutdown():
+    with TestClient(app) as client:
+        headers = add_user(11, "device11")
+        client.get("/users/me/", headers={**headers, "X-Device-ID": "device11"})
+        client.get("/users/me/", headers={**headers, "X-Device-ID": "made-up"})
+
+        response = client.get("/users/me/devices", headers=headers)
+        assert response.status_code == 200
+        devices = response.json()
+        assert [d["device_id"] for d in devices] == ["device11"]
+        assert devices[0]["ip_address"] == "testclient"
+
+    device = stored_device("device11")
+    assert device.ip_address == "testclient"
+    last_used = device.last_used.replace(tzinfo=timezone.utc)
+    assert datetime.now(timezone.utc) - last_used < timedelta(minutes=1)
+
+
+def test_devices_requires_authentication(client):
+    assert client.get("/users/me/devices").status_code == 401
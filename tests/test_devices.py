@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""tests for the device activity tracker"""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import pytest
+from engine.dbase import DBSessionManager
+from entity.device_entity import DeviceType
+from models.user import User, UserDevice
+from services.devices import DeviceTracker
+
+
+T0 = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_manager():
+    db_manager = DBSessionManager(dbname=':memory:')
+    db_manager.create_tables()
+    with db_manager.session_scope() as session:
+        session.add(User(id=1, username="alice", email="alice@example.com"))
+        session.add(UserDevice(
+            user_id=1,
+            device_type=DeviceType.MOBILE,
+            device_id="phone",
+            last_used=T0 - timedelta(days=1)
+        ))
+    return db_manager
+
+
+@pytest.fixture
+def tracker(db_manager):
+    return DeviceTracker(db_manager, flush_interval=60, active_window=30)
+
+
+def stored_device(db_manager):
+    return db_manager.query(UserDevice, filters={"device_id": "phone"})[0]
+
+
+def test_touch_ignores_unregistered_devices(tracker):
+    assert tracker.touch(1, "made-up", "10.0.0.1", now=T0) is None
+    assert tracker.touch(2, "phone", "10.0.0.1", now=T0) is None
+    assert tracker.active_devices(1, now=T0) == []
+
+
+def test_register_adds_device_to_cache(tracker):
+    tracker.register(1, "laptop", now=T0)
+    assert tracker.touch(1, "laptop", now=T0) is not None
+
+
+def test_registry_reloads_after_ttl(db_manager, tracker):
+    assert tracker.touch(1, "tablet", now=T0) is None
+    db_manager.add(UserDevice(
+        user_id=1, device_type=DeviceType.TABLET, device_id="tablet"
+    ))
+
+    # The empty result is cached only until the registry TTL expires
+    assert tracker.touch(1, "tablet", now=T0 + timedelta(seconds=30)) is None
+    assert tracker.touch(1, "tablet", now=T0 + timedelta(seconds=60)) \
+        is not None
+
+
+def test_flush_evicts_expired_registry_entries(db_manager, tracker):
+    tracker.touch(1, "phone", now=T0)
+    with patch.object(db_manager, "session_scope",
+                      wraps=db_manager.session_scope) as scope:
+        tracker.flush(now=T0 + timedelta(seconds=60))
+        writes = scope.call_count
+        # Evicted, so the next touch reloads from the database
+        tracker.touch(1, "phone", now=T0 + timedelta(seconds=61))
+        assert scope.call_count == writes + 1
+
+
+def test_flush_writes_each_device_once_per_interval(db_manager, tracker):
+    tracker.touch(1, "phone", "10.0.0.1", now=T0)
+    assert tracker.flush(now=T0) == 1
+    assert stored_device(db_manager).ip_address == "10.0.0.1"
+
+    # Activity inside the interval is coalesced, not written
+    tracker.touch(1, "phone", "10.0.0.2", now=T0 + timedelta(seconds=10))
+    tracker.touch(1, "phone", "10.0.0.3", now=T0 + timedelta(seconds=20))
+    assert tracker.flush(now=T0 + timedelta(seconds=30)) == 0
+    assert stored_device(db_manager).ip_address == "10.0.0.1"
+
+    assert tracker.flush(now=T0 + timedelta(seconds=60)) == 1
+    device = stored_device(db_manager)
+    assert device.ip_address == "10.0.0.3"
+    assert device.last_used.replace(tzinfo=timezone.utc) == \
+        T0 + timedelta(seconds=20)
+
+
+def test_flush_skips_clean_records(tracker):
+    tracker.touch(1, "phone", now=T0)
+    assert tracker.flush(now=T0) == 1
+    assert tracker.flush(now=T0 + timedelta(minutes=5)) == 0
+
+
+def test_forced_flush_ignores_interval(db_manager, tracker):
+    tracker.touch(1, "phone", "10.0.0.1", now=T0)
+    tracker.flush(now=T0)
+    tracker.touch(1, "phone", "10.0.0.2", now=T0 + timedelta(seconds=5))
+    assert tracker.flush(force=True, now=T0 + timedelta(seconds=5)) == 1
+    assert stored_device(db_manager).ip_address == "10.0.0.2"
+
+
+def test_failed_flush_keeps_records_for_retry(db_manager, tracker):
+    tracker.touch(1, "phone", "10.0.0.1", now=T0)
+    later = T0 + timedelta(hours=1)
+
+    # The record is idle by `later`, but must survive a failed write
+    with patch.object(db_manager, "session_scope",
+                      side_effect=RuntimeError("database is locked")):
+        with pytest.raises(RuntimeError):
+            tracker.flush(now=later)
+
+    assert tracker.flush(now=later) == 1
+    assert stored_device(db_manager).ip_address == "10.0.0.1"
+    # Once written, the idle record is dropped
+    assert tracker.flush(force=True, now=later) == 0
+    assert tracker.active_devices(1, now=T0) == []
+
+
+def test_active_devices_filters_by_window(db_manager, tracker):
+    db_manager.add(UserDevice(
+        user_id=1, device_type=DeviceType.DESKTOP, device_id="laptop"
+    ))
+    tracker.touch(1, "phone", now=T0)
+    tracker.touch(1, "laptop", now=T0 + timedelta(minutes=20))
+
+    devices = tracker.active_devices(1, now=T0 + timedelta(minutes=25))
+    assert [d.device_id for d in devices] == ["laptop", "phone"]
+
+    devices = tracker.active_devices(1, now=T0 + timedelta(minutes=45))
+    assert [d.device_id for d in devices] == ["laptop"]
+    assert tracker.active_devices(2, now=T0) == []